@@ -1,3 +1,4 @@
+import functools
 import os
 
 from ..defines import GCP_CREDS_LOCAL_FILE
@@ -7,9 +8,23 @@
 
 SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
 
+INTEGRATION_SUITES_DIR = os.path.join("integration_tests", "test_suites")
+K8S_INTEGRATION_SUITE = os.path.join(INTEGRATION_SUITES_DIR, "k8s-integration-test-suite")
+CELERY_K8S_INTEGRATION_SUITE = os.path.join(
+    INTEGRATION_SUITES_DIR, "celery-k8s-integration-test-suite"
+)
+K8S_TEST_INFRA_DIR = os.path.join("integration_tests", "python_modules", "dagster-k8s-test-infra")
+
 
 def integration_suite_extra_cmds_fn(version):
-    return [
+    # Return a fresh list so callers can't mutate the cached commands
+    return list(_integration_suite_extra_cmds(version))
+
+
+# Called once per tox env suffix for each version, so memoize.
+@functools.lru_cache(maxsize=None)
+def _integration_suite_extra_cmds(version):
+    return (
         'export AIRFLOW_HOME="/airflow"',
         "mkdir -p $${AIRFLOW_HOME}",
         "export DAGSTER_DOCKER_IMAGE_TAG=$${BUILDKITE_BUILD_ID}-" + version,
@@ -27,36 +42,31 @@ def integration_suite_extra_cmds_fn(version):
         network_buildkite_container("rabbitmq"),
         connect_sibling_docker_container("rabbitmq", "test-rabbitmq", "DAGSTER_CELERY_BROKER_HOST"),
         "popd",
-    ]
+    )
 
 
 def integration_steps():
     tests = []
     tests += publish_test_images()
     tests += ModuleBuildSpec(
-        os.path.join("integration_tests", "python_modules", "dagster-k8s-test-infra"),
+        K8S_TEST_INFRA_DIR,
         upload_coverage=True,
     ).get_tox_build_steps()
 
     integration_suites_root = os.path.join(
-        SCRIPT_PATH, "..", "..", "..", "..", "integration_tests", "test_suites"
+        SCRIPT_PATH, "..", "..", "..", "..", INTEGRATION_SUITES_DIR
     )
     integration_suites = [
-        os.path.join("integration_tests", "test_suites", suite)
-        for suite in os.listdir(integration_suites_root)
+        os.path.join(INTEGRATION_SUITES_DIR, suite) for suite in os.listdir(integration_suites_root)
     ]
 
     for integration_suite in integration_suites:
         tox_env_suffixes = None
         upload_coverage = False
-        if integration_suite == os.path.join(
-            "integration_tests", "test_suites", "k8s-integration-test-suite"
-        ):
+        if integration_suite == K8S_INTEGRATION_SUITE:
             tox_env_suffixes = ["-default"]
             upload_coverage = True
-        elif integration_suite == os.path.join(
-            "integration_tests", "test_suites", "celery-k8s-integration-test-suite"
-        ):
+        elif integration_suite == CELERY_K8S_INTEGRATION_SUITE:
             tox_env_suffixes = [
                 "-default",
                 "-markusercodedeployment",
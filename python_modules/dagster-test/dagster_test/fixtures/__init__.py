@@ -1,2 +1,2 @@
-from .docker_compose import docker_compose, docker_compose_cm
+from .docker_compose import docker_client, docker_compose, docker_compose_cm
 from .utils import retrying_requests, test_directory, test_id
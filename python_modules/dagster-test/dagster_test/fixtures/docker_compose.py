@@ -1,16 +1,28 @@
 # pylint: disable=redefined-outer-name
-import json
+import functools
 import os
+import re
+import shutil
 import subprocess
 from contextlib import contextmanager
 
+import docker
 import pytest
 
 from .utils import BUILDKITE
 
 
+@pytest.fixture(scope="session")
+def docker_client():
+    client = docker.from_env()
+    try:
+        yield client
+    finally:
+        client.close()
+
+
 @pytest.fixture(scope="module")
-def docker_compose_cm(test_directory):
+def docker_compose_cm(test_directory, docker_client):
     @contextmanager
     def docker_compose(
         docker_compose_yml=None,
@@ -27,12 +39,17 @@ def docker_compose(
                 # When running in a container on Buildkite, we need to first connect our container
                 # and our network and then yield a dict of container name to the container's
                 # hostname.
-                with buildkite_hostnames_cm(network_name) as hostnames:
+                with buildkite_hostnames_cm(docker_client, network_name) as hostnames:
                     yield hostnames
             else:
                 # When running locally, we don't need to jump through any special networking hoops;
-                # just yield a dict of container name to "localhost".
-                yield dict((container, "localhost") for container in list_containers())
+                # just yield a dict of this project's container names to "localhost".
+                yield dict(
+                    (container, "localhost")
+                    for container in list_containers(
+                        docker_client, project_name_from_yml(docker_compose_yml)
+                    )
+                )
         finally:
             docker_compose_down(docker_compose_yml, docker_context)
 
@@ -45,83 +62,129 @@ def docker_compose(docker_compose_cm):
         yield docker_compose
 
 
-def docker_compose_up(docker_compose_yml, context):
+@functools.lru_cache(maxsize=None)
+def compose_command(context):
+    docker = executable("docker")
     if context:
-        compose_command = ["docker", "--context", context, "compose"]
-    else:
-        compose_command = ["docker-compose"]
-    subprocess.check_call(
-        compose_command
+        return (docker, "--context", context, "compose")
+    # Prefer the Compose V2 plugin when it's installed; fall back to the standalone binary.
+    if has_compose_plugin():
+        return (docker, "compose")
+    return (executable("docker-compose"),)
+
+
+@functools.lru_cache(maxsize=None)
+def has_compose_plugin():
+    return (
+        call(
+            [executable("docker"), "compose", "version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        == 0
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def executable(name):
+    return shutil.which(name) or name
+
+
+# subprocess only uses its posix_spawn fast path (instead of forking this large pytest process)
+# when given an absolute executable path and close_fds=False. Python's own file descriptors are
+# non-inheritable by default, so nothing leaks into the child. Every compose-related spawn goes
+# through one of these two helpers.
+def call(command, **kwargs):
+    return subprocess.call(command, close_fds=False, **kwargs)
+
+
+def check_call(command, **kwargs):
+    subprocess.check_call(command, close_fds=False, **kwargs)
+
+
+def docker_compose_up(docker_compose_yml, context):
+    check_call(
+        list(compose_command(context))
         + [
+            "--project-name",
+            project_name_from_yml(docker_compose_yml),
             "--file",
             str(docker_compose_yml),
             "up",
             "--detach",
-        ]
+        ],
+        env=compose_env(),
     )
 
 
+def compose_env():
+    # Build any service images with BuildKit so independent build stages run concurrently.
+    env = {
+        "COMPOSE_DOCKER_CLI_BUILD": "1",
+        "DOCKER_BUILDKIT": "1",
+    }
+    env.update(os.environ)
+    return env
+
+
 def docker_compose_down(docker_compose_yml, context):
-    if context:
-        compose_command = ["docker", "--context", context, "compose"]
-    else:
-        compose_command = ["docker-compose"]
-    subprocess.check_call(
-        compose_command
+    check_call(
+        list(compose_command(context))
         + [
+            "--project-name",
+            project_name_from_yml(docker_compose_yml),
             "--file",
             str(docker_compose_yml),
             "down",
+            # Tests don't need a graceful shutdown, so don't wait the default 10 seconds per
+            # container for SIGTERM before killing it.
+            "--timeout",
+            "1",
+            "--remove-orphans",
         ]
     )
 
 
-def list_containers():
+def list_containers(client, project_name=None):
     # TODO: Handle default container names: {project_name}_service_{task_number}
-    return subprocess.check_output(["docker", "ps", "--format", "{{.Names}}"]).decode().splitlines()
+    filters = {"label": f"com.docker.compose.project={project_name}"} if project_name else None
+    return [container.name for container in client.containers.list(filters=filters)]
 
 
-def current_container():
-    container_id = subprocess.check_output(["cat", "/etc/hostname"]).strip().decode()
-    container = (
-        subprocess.check_output(
-            ["docker", "ps", "--filter", f"id={container_id}", "--format", "{{.Names}}"]
-        )
-        .strip()
-        .decode()
-    )
-    return container
+def current_container(client):
+    with open("/etc/hostname") as f:
+        container_id = f.read().strip()
+    return client.containers.get(container_id).name
 
 
-def connect_container_to_network(container, network):
-    subprocess.check_call(["docker", "network", "connect", network, container])
+def connect_container_to_network(client, container, network):
+    client.networks.get(network).connect(container)
 
 
-def disconnect_container_from_network(container, network):
-    subprocess.check_call(["docker", "network", "disconnect", network, container])
+def disconnect_container_from_network(client, container, network):
+    client.networks.get(network).disconnect(container)
 
 
-def hostnames(network):
-    hostnames = {}
-    for container in list_containers():
-        output = subprocess.check_output(["docker", "inspect", container])
-        networking = json.loads(output)[0]["NetworkSettings"]
-        hostname = networking["Networks"].get(network, {}).get("IPAddress")
-        if hostname:
-            hostnames[container] = hostname
-    return hostnames
+def hostnames(client, network):
+    # Inspecting the network returns exactly its member containers along with their addresses.
+    containers = client.networks.get(network).attrs["Containers"] or {}
+    return {
+        container["Name"]: container["IPv4Address"].split("/")[0]
+        for container in containers.values()
+        if container.get("IPv4Address")
+    }
 
 
 @contextmanager
-def buildkite_hostnames_cm(network):
-    container = current_container()
+def buildkite_hostnames_cm(client, network):
+    container = current_container(client)
 
     try:
-        connect_container_to_network(container, network)
-        yield hostnames(network)
+        connect_container_to_network(client, container, network)
+        yield hostnames(client, network)
 
     finally:
-        disconnect_container_from_network(container, network)
+        disconnect_container_from_network(client, container, network)
 
 
 def default_docker_compose_yml(default_directory):
@@ -132,6 +195,14 @@ def default_docker_compose_yml(default_directory):
 
 
 def network_name_from_yml(docker_compose_yml):
-    dirname = os.path.dirname(docker_compose_yml)
-    basename = os.path.basename(dirname)
-    return basename + "_default"
+    return project_name_from_yml(docker_compose_yml) + "_default"
+
+
+def project_name_from_yml(docker_compose_yml):
+    # We pass this to compose explicitly as --project-name so that it (and not COMPOSE_PROJECT_NAME,
+    # a top-level `name:`, or a context backend) decides the project's labels and network name.
+    # It mirrors Compose's own default: the yml's directory, keeping only lowercase alphanumerics,
+    # dashes, and underscores, and without leading dashes or underscores (Compose v2 rejects a
+    # project name that doesn't start with a letter or digit).
+    basename = os.path.basename(os.path.dirname(str(docker_compose_yml)))
+    return re.sub(r"[^-_a-z0-9]", "", basename.lower()).lstrip("-_")
@@ -4,6 +4,7 @@
 
 import pytest
 import yaml
+from dagster_test.fixtures.docker_compose import network_name_from_yml, project_name_from_yml
 
 pytest_plugins = ["dagster_test.fixtures"]
 
@@ -50,3 +51,18 @@ def test_docker_compose_cm_with_network(request, docker_compose_cm, retrying_req
     ) as docker_compose:
         assert "network" in subprocess.check_output(["docker", "network", "ls"]).decode()
         assert retrying_requests.get(f"http://{docker_compose['server']}:8000").ok
+
+
+@pytest.mark.parametrize(
+    "docker_compose_yml, project_name",
+    [
+        ("/tests/fixtures_tests/docker-compose.yml", "fixtures_tests"),
+        ("/tests/My Project.v2/docker-compose.yml", "myprojectv2"),
+        ("/tests/deploy-ecs/docker-compose.yml", "deploy-ecs"),
+        ("/tests/_e2e/docker-compose.yml", "e2e"),
+        ("/tests/-_my_tests/docker-compose.yml", "my_tests"),
+    ],
+)
+def test_project_name_from_yml(docker_compose_yml, project_name):
+    assert project_name_from_yml(docker_compose_yml) == project_name
+    assert network_name_from_yml(docker_compose_yml) == project_name + "_default"
@@ -33,6 +33,7 @@ def get_version() -> str:
         packages=find_packages(exclude=["test"]),
         install_requires=[
             f"dagster{pin}",
+            "docker",
             "pyspark",
         ],
         zip_safe=False,
@@ -35,131 +35,170 @@ def _cli_load_invariant(condition, msg=None):
         raise UsageError(msg)
 
 
-def _check_cli_arguments_none(kwargs, *keys):
-    for key in keys:
-        _cli_load_invariant(not kwargs.get(key))
-
-
-def are_all_keys_empty(kwargs, keys):
-    for key in keys:
-        if kwargs.get(key):
-            return False
-
-    return True
-
-
-WORKSPACE_CLI_ARGS = (
-    "workspace",
-    "python_file",
-    "working_directory",
-    "empty_working_directory",
-    "package_name",
-    "module_name",
-    "attribute",
-    "repository_yaml",
-    "grpc_host",
-    "grpc_port",
-    "grpc_socket",
+def _present_cli_args(kwargs):
+    return frozenset(key for key, value in kwargs.items() if value)
+
+
+def _check_cli_arguments_absent(present_args, forbidden_args):
+    _cli_load_invariant(present_args.isdisjoint(forbidden_args))
+
+
+WORKSPACE_CLI_ARGS = frozenset(
+    (
+        "workspace",
+        "python_file",
+        "working_directory",
+        "empty_working_directory",
+        "package_name",
+        "module_name",
+        "attribute",
+        "repository_yaml",
+        "grpc_host",
+        "grpc_port",
+        "grpc_socket",
+    )
+)
+
+
+# CLI arguments that can't be combined with each kind of workspace load target
+_WORKSPACE_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "python_file",
+        "working_directory",
+        "empty_working_directory",
+        "module_name",
+        "package_name",
+        "attribute",
+        "grpc_host",
+        "grpc_port",
+        "grpc_socket",
+    )
+)
+_PYTHON_FILE_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "module_name",
+        "package_name",
+        "grpc_host",
+        "grpc_port",
+        "grpc_socket",
+    )
+)
+_MODULE_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "package_name",
+        "working_directory",
+        "empty_working_directory",
+        "grpc_host",
+        "grpc_port",
+        "grpc_socket",
+    )
+)
+_PACKAGE_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "working_directory",
+        "empty_working_directory",
+        "grpc_host",
+        "grpc_port",
+        "grpc_socket",
+    )
+)
+_GRPC_PORT_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "attribute",
+        "working_directory",
+        "empty_working_directory",
+        "grpc_socket",
+    )
+)
+_GRPC_SOCKET_TARGET_FORBIDDEN_ARGS = frozenset(
+    (
+        "attribute",
+        "working_directory",
+        "empty_working_directory",
+    )
+)
+
+# CLI arguments that can't be combined with each kind of python origin target
+_PYTHON_FILE_ORIGIN_FORBIDDEN_ARGS = frozenset(("module_name", "package_name"))
+_MODULE_ORIGIN_FORBIDDEN_ARGS = frozenset(("python_file", "working_directory", "package_name"))
+_PACKAGE_ORIGIN_FORBIDDEN_ARGS = frozenset(("module_name", "python_file", "working_directory"))
+
+
+def _workspace_file_target(kwargs):
+    return WorkspaceFileTarget(paths=list(kwargs["workspace"]))
+
+
+def _python_file_target(kwargs):
+    return PythonFileTarget(
+        python_file=kwargs.get("python_file"),
+        attribute=kwargs.get("attribute"),
+        working_directory=get_working_directory_from_kwargs(kwargs),
+        location_name=None,
+    )
+
+
+def _module_target(kwargs):
+    return ModuleTarget(
+        module_name=kwargs.get("module_name"),
+        attribute=kwargs.get("attribute"),
+        location_name=None,
+    )
+
+
+def _package_target(kwargs):
+    return PackageTarget(
+        package_name=kwargs.get("package_name"),
+        attribute=kwargs.get("attribute"),
+        location_name=None,
+    )
+
+
+def _grpc_port_target(kwargs):
+    return GrpcServerTarget(
+        port=kwargs.get("grpc_port"),
+        socket=None,
+        host=(kwargs.get("grpc_host") if kwargs.get("grpc_host") else "localhost"),
+        location_name=None,
+    )
+
+
+def _grpc_socket_target(kwargs):
+    return GrpcServerTarget(
+        port=None,
+        socket=kwargs.get("grpc_socket"),
+        host=(kwargs.get("grpc_host") if kwargs.get("grpc_host") else "localhost"),
+        location_name=None,
+    )
+
+
+# In order of precedence: (selecting argument, conflicting arguments, load target factory)
+_WORKSPACE_LOAD_TARGETS = (
+    ("workspace", _WORKSPACE_TARGET_FORBIDDEN_ARGS, _workspace_file_target),
+    ("python_file", _PYTHON_FILE_TARGET_FORBIDDEN_ARGS, _python_file_target),
+    ("module_name", _MODULE_TARGET_FORBIDDEN_ARGS, _module_target),
+    ("package_name", _PACKAGE_TARGET_FORBIDDEN_ARGS, _package_target),
+    ("grpc_port", _GRPC_PORT_TARGET_FORBIDDEN_ARGS, _grpc_port_target),
+    ("grpc_socket", _GRPC_SOCKET_TARGET_FORBIDDEN_ARGS, _grpc_socket_target),
 )
 
 
 def created_workspace_load_target(kwargs):
     check.dict_param(kwargs, "kwargs")
-    if are_all_keys_empty(kwargs, WORKSPACE_CLI_ARGS):
+    # Collect the provided arguments once, so every check below is a set operation
+    present_args = _present_cli_args(kwargs)
+    if present_args.isdisjoint(WORKSPACE_CLI_ARGS):
         if kwargs.get("empty_workspace"):
             return EmptyWorkspaceTarget()
         if os.path.exists("workspace.yaml"):
             return WorkspaceFileTarget(paths=["workspace.yaml"])
         raise click.UsageError("No arguments given and workspace.yaml not found.")
 
-    if kwargs.get("workspace"):
-        _check_cli_arguments_none(
-            kwargs,
-            "python_file",
-            "working_directory",
-            "empty_working_directory",
-            "module_name",
-            "package_name",
-            "attribute",
-            "grpc_host",
-            "grpc_port",
-            "grpc_socket",
-        )
-        return WorkspaceFileTarget(paths=list(kwargs["workspace"]))
-    if kwargs.get("python_file"):
-        _check_cli_arguments_none(
-            kwargs,
-            "module_name",
-            "package_name",
-            "grpc_host",
-            "grpc_port",
-            "grpc_socket",
-        )
-        working_directory = get_working_directory_from_kwargs(kwargs)
-        return PythonFileTarget(
-            python_file=kwargs.get("python_file"),
-            attribute=kwargs.get("attribute"),
-            working_directory=working_directory,
-            location_name=None,
-        )
-    if kwargs.get("module_name"):
-        _check_cli_arguments_none(
-            kwargs,
-            "package_name",
-            "working_directory",
-            "empty_working_directory",
-            "grpc_host",
-            "grpc_port",
-            "grpc_socket",
-        )
-        return ModuleTarget(
-            module_name=kwargs.get("module_name"),
-            attribute=kwargs.get("attribute"),
-            location_name=None,
-        )
-    if kwargs.get("package_name"):
-        _check_cli_arguments_none(
-            kwargs,
-            "working_directory",
-            "empty_working_directory",
-            "grpc_host",
-            "grpc_port",
-            "grpc_socket",
-        )
-        return PackageTarget(
-            package_name=kwargs.get("package_name"),
-            attribute=kwargs.get("attribute"),
-            location_name=None,
-        )
-    if kwargs.get("grpc_port"):
-        _check_cli_arguments_none(
-            kwargs,
-            "attribute",
-            "working_directory",
-            "empty_working_directory",
-            "grpc_socket",
-        )
-        return GrpcServerTarget(
-            port=kwargs.get("grpc_port"),
-            socket=None,
-            host=(kwargs.get("grpc_host") if kwargs.get("grpc_host") else "localhost"),
-            location_name=None,
-        )
-    elif kwargs.get("grpc_socket"):
-        _check_cli_arguments_none(
-            kwargs,
-            "attribute",
-            "working_directory",
-            "empty_working_directory",
-        )
-        return GrpcServerTarget(
-            port=None,
-            socket=kwargs.get("grpc_socket"),
-            host=(kwargs.get("grpc_host") if kwargs.get("grpc_host") else "localhost"),
-            location_name=None,
-        )
-    else:
-        _cli_load_invariant(False)
+    for key, forbidden_args, load_target_fn in _WORKSPACE_LOAD_TARGETS:
+        if key in present_args:
+            _check_cli_arguments_absent(present_args, forbidden_args)
+            return load_target_fn(kwargs)
+
+    _cli_load_invariant(False)
 
 
 def get_workspace_process_context_from_kwargs(
@@ -380,10 +419,11 @@ def get_pipeline_python_origin_from_kwargs(kwargs):
     recon_repo = recon_repository_from_origin(repository_origin)
     repo_definition = recon_repo.get_definition()
 
-    pipeline_names = set(repo_definition.pipeline_names)
+    # Pipeline names are unique within a repository, so there's no need to build a set
+    pipeline_names = repo_definition.pipeline_names
 
     if provided_pipeline_name is None and len(pipeline_names) == 1:
-        pipeline_name = next(iter(pipeline_names))
+        pipeline_name = pipeline_names[0]
     elif provided_pipeline_name is None:
         raise click.UsageError(
             (
@@ -391,7 +431,7 @@ def get_pipeline_python_origin_from_kwargs(kwargs):
                 "in {repository}. Options are: {pipelines}."
             ).format(repository=repo_definition.name, pipelines=_sorted_quoted(pipeline_names))
         )
-    elif not provided_pipeline_name in pipeline_names:
+    elif not repo_definition.has_pipeline(provided_pipeline_name):
         raise click.UsageError(
             (
                 'Pipeline "{provided_pipeline_name}" not found in repository "{repository_name}". '
@@ -408,47 +448,44 @@ def get_pipeline_python_origin_from_kwargs(kwargs):
     return PipelinePythonOrigin(pipeline_name, repository_origin=repository_origin)
 
 
-def _get_code_pointer_dict_from_kwargs(kwargs):
+def _get_loadable_targets_from_kwargs(kwargs):
+    """Returns the loadable targets for the given CLI arguments, along with a function that builds
+    a CodePointer to one of them from its attribute."""
     python_file = kwargs.get("python_file")
     module_name = kwargs.get("module_name")
     package_name = kwargs.get("package_name")
     working_directory = get_working_directory_from_kwargs(kwargs)
     attribute = kwargs.get("attribute")
+    present_args = _present_cli_args(kwargs)
     if python_file:
-        _check_cli_arguments_none(kwargs, "module_name", "package_name")
-        return {
-            repository_def_from_target_def(
-                loadable_target.target_definition
-            ).name: CodePointer.from_python_file(
-                python_file, loadable_target.attribute, working_directory
-            )
-            for loadable_target in get_loadable_targets(
-                python_file, module_name, package_name, working_directory, attribute
-            )
-        }
+        _check_cli_arguments_absent(present_args, _PYTHON_FILE_ORIGIN_FORBIDDEN_ARGS)
+        code_pointer_fn = lambda attr: CodePointer.from_python_file(
+            python_file, attr, working_directory
+        )
     elif module_name:
-        _check_cli_arguments_none(kwargs, "python_file", "working_directory", "package_name")
-        return {
-            repository_def_from_target_def(
-                loadable_target.target_definition
-            ).name: CodePointer.from_module(module_name, loadable_target.attribute)
-            for loadable_target in get_loadable_targets(
-                python_file, module_name, package_name, working_directory, attribute
-            )
-        }
+        _check_cli_arguments_absent(present_args, _MODULE_ORIGIN_FORBIDDEN_ARGS)
+        code_pointer_fn = lambda attr: CodePointer.from_module(module_name, attr)
     elif package_name:
-        _check_cli_arguments_none(kwargs, "module_name", "python_file", "working_directory")
-        return {
-            repository_def_from_target_def(
-                loadable_target.target_definition
-            ).name: CodePointer.from_python_package(package_name, loadable_target.attribute)
-            for loadable_target in get_loadable_targets(
-                python_file, module_name, package_name, working_directory, attribute
-            )
-        }
+        _check_cli_arguments_absent(present_args, _PACKAGE_ORIGIN_FORBIDDEN_ARGS)
+        code_pointer_fn = lambda attr: CodePointer.from_python_package(package_name, attr)
     else:
         check.failed("Must specify a Python file or module name")
 
+    # Loading targets imports user code, so do it exactly once whichever kind of target was given
+    loadable_targets = get_loadable_targets(
+        python_file, module_name, package_name, working_directory, attribute
+    )
+    return loadable_targets, code_pointer_fn
+
+
+def _get_code_pointer_dict(loadable_targets, code_pointer_fn):
+    return {
+        repository_def_from_target_def(loadable_target.target_definition).name: code_pointer_fn(
+            loadable_target.attribute
+        )
+        for loadable_target in loadable_targets
+    }
+
 
 def get_working_directory_from_kwargs(kwargs):
     if kwargs.get("empty_working_directory"):
@@ -467,21 +504,22 @@ def get_repository_python_origin_from_kwargs(kwargs):
     # definitions - we may need to return an origin for a non-existent repository
     # (e.g. to log an origin ID for an error message)
     if kwargs.get("attribute") and not provided_repo_name:
+        present_args = _present_cli_args(kwargs)
         if kwargs.get("python_file"):
-            _check_cli_arguments_none(kwargs, "module_name", "package_name")
+            _check_cli_arguments_absent(present_args, _PYTHON_FILE_ORIGIN_FORBIDDEN_ARGS)
             code_pointer = CodePointer.from_python_file(
                 kwargs.get("python_file"),
                 kwargs.get("attribute"),
                 get_working_directory_from_kwargs(kwargs),
             )
         elif kwargs.get("module_name"):
-            _check_cli_arguments_none(kwargs, "python_file", "working_directory", "package_name")
+            _check_cli_arguments_absent(present_args, _MODULE_ORIGIN_FORBIDDEN_ARGS)
             code_pointer = CodePointer.from_module(
                 kwargs.get("module_name"),
                 kwargs.get("attribute"),
             )
         elif kwargs.get("package_name"):
-            _check_cli_arguments_none(kwargs, "python_file", "working_directory", "module_name")
+            _check_cli_arguments_absent(present_args, _PACKAGE_ORIGIN_FORBIDDEN_ARGS)
             code_pointer = CodePointer.from_python_package(
                 kwargs.get("package_name"),
                 kwargs.get("attribute"),
@@ -490,7 +528,17 @@ def get_repository_python_origin_from_kwargs(kwargs):
             check.failed("Must specify a Python file or module name")
         return RepositoryPythonOrigin(executable_path=sys.executable, code_pointer=code_pointer)
 
-    code_pointer_dict = _get_code_pointer_dict_from_kwargs(kwargs)
+    loadable_targets, code_pointer_fn = _get_loadable_targets_from_kwargs(kwargs)
+
+    # With a single target and no repository name to match, there's no need to build the target's
+    # repository definition just to learn its name
+    if provided_repo_name is None and len(loadable_targets) == 1:
+        return RepositoryPythonOrigin(
+            executable_path=sys.executable,
+            code_pointer=code_pointer_fn(loadable_targets[0].attribute),
+        )
+
+    code_pointer_dict = _get_code_pointer_dict(loadable_targets, code_pointer_fn)
     if provided_repo_name is None and len(code_pointer_dict) == 1:
         code_pointer = next(iter(code_pointer_dict.values()))
     elif provided_repo_name is None:
@@ -606,24 +654,25 @@ def get_external_pipeline_from_external_repo(external_repo, provided_pipeline_na
     check.inst_param(external_repo, "external_repo", ExternalRepository)
     check.opt_str_param(provided_pipeline_name, "provided_pipeline_name")
 
-    external_pipelines = {ep.name: ep for ep in external_repo.get_all_external_pipelines()}
+    # Only materialize the ExternalPipeline we return, rather than one for every pipeline
+    pipeline_names = [
+        pipeline_index.name for pipeline_index in external_repo.get_pipeline_indices()
+    ]
 
-    check.invariant(external_pipelines)
+    check.invariant(pipeline_names)
 
-    if provided_pipeline_name is None and len(external_pipelines) == 1:
-        return next(iter(external_pipelines.values()))
+    if provided_pipeline_name is None and len(pipeline_names) == 1:
+        return external_repo.get_full_external_pipeline(pipeline_names[0])
 
     if provided_pipeline_name is None:
         raise click.UsageError(
             (
                 "Must provide --pipeline as there is more than one pipeline "
                 "in {repository}. Options are: {pipelines}."
-            ).format(
-                repository=external_repo.name, pipelines=_sorted_quoted(external_pipelines.keys())
-            )
+            ).format(repository=external_repo.name, pipelines=_sorted_quoted(pipeline_names))
         )
 
-    if not provided_pipeline_name in external_pipelines:
+    if not external_repo.has_external_pipeline(provided_pipeline_name):
         raise click.UsageError(
             (
                 'Pipeline "{provided_pipeline_name}" not found in repository "{repository_name}". '
@@ -631,11 +680,11 @@ def get_external_pipeline_from_external_repo(external_repo, provided_pipeline_na
             ).format(
                 provided_pipeline_name=provided_pipeline_name,
                 repository_name=external_repo.name,
-                found_names=_sorted_quoted(external_pipelines.keys()),
+                found_names=_sorted_quoted(pipeline_names),
             )
         )
 
-    return external_pipelines[provided_pipeline_name]
+    return external_repo.get_full_external_pipeline(provided_pipeline_name)
 
 
 @contextmanager
@@ -648,4 +697,4 @@ def get_external_pipeline_from_kwargs(instance, version, kwargs):
 
 
 def _sorted_quoted(strings):
-    return "[" + ", ".join(["'{}'".format(s) for s in sorted(list(strings))]) + "]"
+    return "[" + ", ".join(f"'{s}'" for s in sorted(strings)) + "]"
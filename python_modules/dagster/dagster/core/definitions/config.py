@@ -3,6 +3,7 @@
 from dagster import check
 from dagster.builtins import BuiltinEnum
 from dagster.config import ConfigType
+from dagster.config.config_type import ConfigTypeKind
 from dagster.config.post_process import resolve_defaults
 from dagster.config.validate import process_config, validate_config
 from dagster.core.definitions.definition_config_schema import IDefinitionConfigSchema
@@ -67,9 +68,13 @@ def __new__(
     def resolve_from_unvalidated_config(self, config: Any) -> Any:
         """Validates config against outer config schema, and calls mapping against validated config."""
 
-        receive_processed_config_values = check.opt_bool_param(
-            self.receive_processed_config_values, "receive_processed_config_values", default=True
-        )
+        if self.config_schema.config_type.kind == ConfigTypeKind.ANY:
+            # Any accepts every value unchanged and has no defaults to resolve, so both the
+            # processed and unprocessed paths would hand config_fn the config as given.
+            return self.config_fn(config)
+
+        # Already validated in __new__; None means the default of receiving processed values
+        receive_processed_config_values = self.receive_processed_config_values is not False
         if receive_processed_config_values:
             outer_evr = process_config(
                 self.config_schema.config_type,
@@ -11,6 +11,12 @@
 
 DAGSTER_META_KEY = "dagster_meta"
 
+# attributes present on every LogRecord, i.e. those that can't have come from a log call's `extra`
+_DEFAULT_LOG_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__.keys()) | {
+    "message",
+    "asctime",
+}
+
 
 class DagsterMessageProps(
     NamedTuple(
@@ -124,45 +130,66 @@ def log_source(self):
 
     def to_tags(self) -> Dict[str, str]:
         # converts all values into strings
-        return {k: str(v) for k, v in self._asdict().items()}
+        return {k: str(v) for k, v in zip(self._fields, self)}
 
 
-def construct_log_string(
-    logging_metadata: DagsterLoggingMetadata, message_props: DagsterMessageProps
-) -> str:
+def _log_string_prefix(logging_metadata: DagsterLoggingMetadata) -> List[str]:
+    return [part for part in (logging_metadata.log_source, logging_metadata.run_id) if part]
+
 
+def _construct_log_string(
+    prefix: List[str], step_key: Optional[str], message_props: DagsterMessageProps
+) -> str:
     return (
         " - ".join(
-            filter(
-                None,
-                (
-                    logging_metadata.log_source,
-                    logging_metadata.run_id,
+            prefix
+            + [
+                part
+                for part in (
                     message_props.pid,
-                    logging_metadata.step_key,
+                    step_key,
                     message_props.event_type_value,
                     message_props.orig_message,
-                ),
-            )
+                )
+                if part
+            ]
         )
         + (message_props.error_str or "")
     )
 
 
+def construct_log_string(
+    logging_metadata: DagsterLoggingMetadata, message_props: DagsterMessageProps
+) -> str:
+    return _construct_log_string(
+        _log_string_prefix(logging_metadata), logging_metadata.step_key, message_props
+    )
+
+
 def get_dagster_meta_dict(
     logging_metadata: DagsterLoggingMetadata, dagster_message_props: DagsterMessageProps
 ) -> Dict[str, Any]:
-    # combine all dagster meta information into a single dictionary
-    meta_dict = {
-        **logging_metadata._asdict(),
-        **dagster_message_props._asdict(),
+    # combine all dagster meta information into a single dictionary, built directly from the
+    # fields of both tuples rather than merging their _asdict() copies
+    return {
+        "run_id": logging_metadata.run_id,
+        "pipeline_name": logging_metadata.pipeline_name,
+        "pipeline_tags": logging_metadata.pipeline_tags,
+        # step-level events can be logged from a pipeline context. for these cases, pull the step
+        # key from the underlying DagsterEvent
+        "step_key": (
+            logging_metadata.step_key
+            if logging_metadata.step_key is not None
+            else dagster_message_props.step_key
+        ),
+        "solid_name": logging_metadata.solid_name,
+        "resource_name": logging_metadata.resource_name,
+        "resource_fn_name": logging_metadata.resource_fn_name,
+        "orig_message": dagster_message_props.orig_message,
+        "log_message_id": dagster_message_props.log_message_id,
+        "log_timestamp": dagster_message_props.log_timestamp,
+        "dagster_event": dagster_message_props.dagster_event,
     }
-    # step-level events can be logged from a pipeline context. for these cases, pull the step
-    # key from the underlying DagsterEvent
-    if meta_dict["step_key"] is None:
-        meta_dict["step_key"] = dagster_message_props.step_key
-
-    return meta_dict
 
 
 class DagsterLogHandler(logging.Handler):
@@ -184,6 +211,10 @@ def __init__(
         self._logging_metadata = logging_metadata
         self._loggers = loggers
         self._handlers = handlers
+        # the log source and run id never change for a given handler (with_tags creates a new
+        # handler), so only join them into the log string prefix once
+        self._log_string_prefix = _log_string_prefix(logging_metadata)
+        self._step_key = logging_metadata.step_key
         super().__init__()
 
     @property
@@ -203,12 +234,11 @@ def _extract_extra(self, record: logging.LogRecord) -> Dict[str, Any]:
         This function figures out what the original `extra` values of the log call were by
         comparing the set of attributes in the received record to those of a default record.
         """
-        ref_attrs = list(logging.makeLogRecord({}).__dict__.keys()) + ["message", "asctime"]
-        return {k: v for k, v in record.__dict__.items() if k not in ref_attrs}
+        return {k: v for k, v in record.__dict__.items() if k not in _DEFAULT_LOG_RECORD_ATTRS}
 
     def _convert_record(self, record: logging.LogRecord) -> logging.LogRecord:
         # we store the originating DagsterEvent in the DAGSTER_META_KEY field, if applicable
-        dagster_meta = getattr(record, DAGSTER_META_KEY, None)
+        dagster_meta = record.__dict__.get(DAGSTER_META_KEY)
 
         # generate some properties for this specific record
         dagster_message_props = DagsterMessageProps(
@@ -216,14 +246,14 @@ def _convert_record(self, record: logging.LogRecord) -> logging.LogRecord:
         )
 
         # set the dagster meta info for the record
-        setattr(
-            record,
-            DAGSTER_META_KEY,
-            get_dagster_meta_dict(self._logging_metadata, dagster_message_props),
+        record.__dict__[DAGSTER_META_KEY] = get_dagster_meta_dict(
+            self._logging_metadata, dagster_message_props
         )
 
         # update the message to be formatted like other dagster logs
-        record.msg = construct_log_string(self._logging_metadata, dagster_message_props)
+        record.msg = _construct_log_string(
+            self._log_string_prefix, self._step_key, dagster_message_props
+        )
 
         return record
 
@@ -233,22 +263,28 @@ def filter(self, record: logging.LogRecord) -> bool:
         multiple times, as the DagsterLogHandler will be invoked at each level of the hierarchy as
         the message is propagated. This filter prevents this from happening.
         """
-        return not isinstance(getattr(record, DAGSTER_META_KEY, None), dict)
+        return not isinstance(record.__dict__.get(DAGSTER_META_KEY), dict)
 
     def emit(self, record: logging.LogRecord):
         """For any received record, add Dagster metadata, and have handlers handle it"""
+        if not self._handlers and not self._loggers:
+            # nothing would consume the converted record
+            return
+
         dagster_record = self._convert_record(record)
         # built-in handlers
         for handler in self._handlers:
             handler.handle(dagster_record)
         # user-defined @loggers
-        for logger in self._loggers:
-            logger.log(
-                level=dagster_record.levelno,
-                msg=dagster_record.msg,
-                exc_info=dagster_record.exc_info,
-                extra=self._extract_extra(record),
-            )
+        if self._loggers:
+            extra = self._extract_extra(record)
+            for logger in self._loggers:
+                logger.log(
+                    level=dagster_record.levelno,
+                    msg=dagster_record.msg,
+                    exc_info=dagster_record.exc_info,
+                    extra=extra,
+                )
 
 
 class DagsterLogManager(logging.Logger):
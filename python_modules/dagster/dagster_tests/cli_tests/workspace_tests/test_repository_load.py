@@ -1,8 +1,10 @@
 import click
 import pytest
 from click.testing import CliRunner
+from dagster.cli.workspace import cli_target
 from dagster.cli.workspace.cli_target import (
     get_external_repository_from_kwargs,
+    get_repository_python_origin_from_kwargs,
     repository_target_argument,
 )
 from dagster.core.host_representation import ExternalRepository
@@ -198,3 +200,52 @@ def test_local_directory_module():
 )
 def test_local_directory_file(cli_args):
     successfully_load_repository_via_cli(cli_args)
+
+
+def test_repository_python_origin_single_target_skips_repository_definition(monkeypatch):
+    def _fail(_target_definition):
+        raise Exception("Should not build a repository definition for a single target")
+
+    monkeypatch.setattr(cli_target, "repository_def_from_target_def", _fail)
+
+    origin = get_repository_python_origin_from_kwargs(
+        {
+            "python_file": file_relative_path(
+                __file__, "hello_world_in_file/hello_world_repository.py"
+            )
+        }
+    )
+    assert origin.code_pointer.fn_name == "hello_world_repository"
+
+
+def test_repository_python_origin_multi_repo():
+    python_file = file_relative_path(__file__, "multi_repo/multi_repo.py")
+
+    origin = get_repository_python_origin_from_kwargs(
+        {"python_file": python_file, "repository": "repo_two"}
+    )
+    assert origin.code_pointer.fn_name == "repo_two"
+
+    with pytest.raises(click.UsageError, match="Must provide --repository"):
+        get_repository_python_origin_from_kwargs({"python_file": python_file})
+
+
+@pytest.mark.parametrize("attribute", [None, "hello_world_repository"])
+@pytest.mark.parametrize(
+    "conflicting_args",
+    [
+        {"module_name": "some_module"},
+        {"package_name": "some_package"},
+    ],
+)
+def test_repository_python_origin_conflicting_args(attribute, conflicting_args):
+    with pytest.raises(click.UsageError, match="Invalid set of CLI arguments"):
+        get_repository_python_origin_from_kwargs(
+            {
+                "python_file": file_relative_path(
+                    __file__, "hello_world_in_file/hello_world_repository.py"
+                ),
+                "attribute": attribute,
+                **conflicting_args,
+            }
+        )
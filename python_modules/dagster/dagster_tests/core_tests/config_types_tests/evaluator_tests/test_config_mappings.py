@@ -2,6 +2,7 @@
 
 import pytest
 from dagster import (
+    ConfigMapping,
     DagsterConfigMappingFunctionError,
     DagsterInvalidConfigError,
     DagsterInvalidDefinitionError,
@@ -793,3 +794,14 @@ def wrap_pipeline():
     )
 
     assert result.success
+
+
+@pytest.mark.parametrize("receive_processed_config_values", [None, True, False])
+def test_any_config_schema_passes_config_through(receive_processed_config_values):
+    config = {"foo": [1, {"bar": None}]}
+    config_mapping = ConfigMapping(
+        config_fn=lambda cfg: cfg,
+        receive_processed_config_values=receive_processed_config_values,
+    )
+    assert config_mapping.resolve_from_unvalidated_config(config) == config
+    assert config_mapping.resolve_from_unvalidated_config(None) is None
@@ -14,6 +14,7 @@
     DagsterLoggingMetadata,
     DagsterMessageProps,
     construct_log_string,
+    get_dagster_meta_dict,
 )
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -56,6 +57,17 @@ def test_construct_log_string_for_log():
     )
 
 
+def test_get_dagster_meta_dict():
+    logging_metadata = DagsterLoggingMetadata(run_id="123456", pipeline_name="my_pipeline")
+    dagster_message_props = DagsterMessageProps(orig_message="hear my tale")
+
+    meta_dict = get_dagster_meta_dict(logging_metadata, dagster_message_props)
+    assert meta_dict == {**logging_metadata._asdict(), **dagster_message_props._asdict()}
+    assert list(meta_dict.keys()) == list(
+        DagsterLoggingMetadata._fields + DagsterMessageProps._fields
+    )
+
+
 def make_log_string(error, error_source=None):
     step_failure_event = DagsterEvent(
         event_type_value="STEP_FAILURE",
@@ -163,6 +175,21 @@ def test_construct_log_string_with_error_raise_from():
     assert expected_substr in log_string
 
 
+def test_emit_without_handlers_or_loggers():
+    log_manager = DagsterLogManager(
+        dagster_handler=DagsterLogHandler(
+            logging_metadata=DagsterLoggingMetadata(run_id="123456", pipeline_name="pipeline"),
+            loggers=[],
+            handlers=[],
+        ),
+    )
+    record = logging.makeLogRecord({"msg": "some msg", "levelno": logging.INFO})
+    log_manager.handle(record)
+
+    assert record.msg == "some msg"
+    assert not hasattr(record, "dagster_meta")
+
+
 @pytest.mark.parametrize("use_handler", [True, False])
 def test_user_code_error_boundary_python_capture(use_handler):
     class TestHandler(logging.Handler):